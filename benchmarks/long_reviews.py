@@ -0,0 +1,55 @@
+"""Time ``TextPreprocessor.process`` and the full miner on pathological long reviews.
+
+Run from the repository root:
+
+    python benchmarks/long_reviews.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from aspect_mining import AspectOpinionMiner  # noqa: E402
+from aspect_mining.preprocess import PreprocessConfig  # noqa: E402
+
+SENTENCE = "Battery life is great but camera quality is not good. "
+
+CASES = {
+    "forum post (many short sentences)": SENTENCE * 2_000,
+    "spec sheet (newline-separated lines)": "Weight: 180 g\nDisplay: 6.1 in OLED\nBattery: 4000 mAh\n" * 2_500,
+    "no punctuation (single run-on sentence)": "the screen is bright and the speaker is weak " * 2_500,
+    "no whitespace (single huge token run)": "a" * 120_000,
+}
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    configs = {
+        "chunked": PreprocessConfig(),
+        "limited": PreprocessConfig(max_review_chars=50_000, max_review_seconds=2.0),
+    }
+    miners = {name: AspectOpinionMiner(preprocess_config=cfg) for name, cfg in configs.items()}
+
+    for case, text in CASES.items():
+        print(f"{case}: {len(text):,} chars")
+        for name, miner in miners.items():
+            doc, parse_s = _timed(lambda: miner.preprocessor.process(text))
+            timed_out_before = miner.limit_stats.timed_out
+            rows, total_s = _timed(lambda: miner.analyze(text))
+            flags = {k: doc.user_data.get(k) for k in ("chunks", "truncated")}
+            flags["analyze_timed_out"] = miner.limit_stats.timed_out > timed_out_before
+            print(f"  {name:8s} parse {parse_s:7.3f}s  analyze {total_s:7.3f}s  rows {len(rows):6d}  {flags}")
+
+
+if __name__ == "__main__":
+    main()
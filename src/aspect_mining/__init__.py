@@ -1,5 +1,7 @@
 """Aspect-level opinion mining package."""
 
 from .pipeline import AspectOpinionMiner, ReviewAnalysis
+from .prescreen import LexiconPrescreener
+from .store import AspectAggregateStore
 
-__all__ = ["AspectOpinionMiner", "ReviewAnalysis"]
+__all__ = ["AspectAggregateStore", "AspectOpinionMiner", "LexiconPrescreener", "ReviewAnalysis"]
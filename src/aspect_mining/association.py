@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from collections import defaultdict
 from spacy.tokens import Span
 
@@ -15,14 +16,24 @@ class AspectOpinionAssociator:
         self.features = LinguisticFeatureExtractor()
         self.sentiment = SentimentScorer()
         self._contrast_markers = {"but", "however", "though", "although", "yet"}
+        # Whether the last ``associate`` call stopped at its deadline.
+        self.interrupted = False
 
-    def associate(self, aspects: list[Span]) -> list[AspectSentiment]:
+    def associate(self, aspects: list[Span], deadline: float | None = None) -> list[AspectSentiment]:
+        """Score aspects sentence by sentence.
+
+        When ``deadline`` (a ``time.perf_counter()`` value) has passed, the
+        remaining aspects are skipped, ``interrupted`` is set and the rows so
+        far are returned.
+        """
         by_sentence: dict[int, list[Span]] = defaultdict(list)
         for asp in aspects:
             by_sentence[asp.sent.start].append(asp)
 
         results: list[AspectSentiment] = []
         for sentence_aspects in by_sentence.values():
+            if self._past(deadline):
+                break
             sentence = sentence_aspects[0].sent
             opinion_tokens = self.features.opinion_tokens(sentence)
             boundaries = [sentence.start - 1]
@@ -30,6 +41,8 @@ class AspectOpinionAssociator:
             boundaries.append(sentence.end)
 
             for aspect in sentence_aspects:
+                if self._past(deadline):
+                    break
                 center = aspect.root.i
                 left = max(b for b in boundaries if b < center)
                 right = min(b for b in boundaries if b >= center)
@@ -54,4 +67,9 @@ class AspectOpinionAssociator:
                     )
                 )
 
+        self.interrupted = len(results) < len(aspects)
         return results
+
+    @staticmethod
+    def _past(deadline: float | None) -> bool:
+        return deadline is not None and time.perf_counter() > deadline
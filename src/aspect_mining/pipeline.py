@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .aspect_extractor import AspectExtractor
 from .association import AspectOpinionAssociator
-from .preprocess import TextPreprocessor
+from .prescreen import PRESCREEN_MODES, LexiconPrescreener, PrescreenStats
+from .preprocess import LimitStats, PreprocessConfig, TextPreprocessor
 
 
 @dataclass
@@ -15,6 +16,7 @@ class ReviewAnalysis:
     review_id: int
     review_text: str
     aspects: list[dict]
+    metadata: dict = field(default_factory=dict)
 
 
 class AspectOpinionMiner:
@@ -22,26 +24,89 @@ class AspectOpinionMiner:
 
     This class is intentionally lightweight and modular: each method maps to a
     clear step in a rule-first NLP pipeline so interns can explain the flow.
+
+    ``prescreen`` controls the lexicon fast path: ``"off"`` parses every
+    review, ``"skip"`` returns no rows for reviews without any possible opinion
+    word, and ``"audit"`` still runs the full parse for those reviews, returns
+    its result and compares it with the fast path's ``[]`` in
+    ``prescreen_stats``. Skipped reviews would only have produced neutral,
+    evidence-free rows, so skipping never changes sentiment but does lower
+    ``frequency`` and ``neutral`` counts in aggregates.
+
+    A review cut short by ``PreprocessConfig`` limits is counted in
+    ``limit_stats`` and, in ``analyze_reviews``, marked with ``"truncated"``
+    and/or ``"timed_out"`` in its ``ReviewAnalysis.metadata``.
     """
 
-    def __init__(self):
-        self.preprocessor = TextPreprocessor()
+    def __init__(self, prescreen: str = "off", preprocess_config: PreprocessConfig | None = None):
+        if prescreen not in PRESCREEN_MODES:
+            raise ValueError(f"prescreen must be one of {sorted(PRESCREEN_MODES)}, got {prescreen!r}")
+        self.prescreen = prescreen
+        self.prescreener = LexiconPrescreener()
+        self.prescreen_stats = PrescreenStats()
+        self.preprocessor = TextPreprocessor(preprocess_config)
+        self.limit_stats = LimitStats()
         self.aspect_extractor = AspectExtractor()
         self.associator = AspectOpinionAssociator()
 
     def analyze(self, text: str) -> list[dict]:
         """Analyze a single review and return aspect-level results."""
-        doc = self.preprocessor.process(text)
+        rows, _ = self._analyze(text)
+        return rows
+
+    def _analyze(self, text: str) -> tuple[list[dict], dict]:
+        """Return the review's rows and the limits it hit (``{}`` when complete)."""
+        if self.prescreen == "off":
+            return self._analyze_full(text)
+
+        stats = self.prescreen_stats
+        stats.screened += 1
+        if self.prescreener.has_opinion(text):
+            return self._analyze_full(text)
+        if self.prescreen == "skip":
+            stats.skipped += 1
+            return [], {}
+
+        rows, limits = self._analyze_full(text)
+        stats.audited += 1
+        if rows:
+            stats.audit_mismatches += 1
+            stats.audit_dropped_rows += len(rows)
+        if any(row["sentiment"] != "neutral" or row["evidences"] for row in rows):
+            stats.audit_sentiment_mismatches += 1
+        return rows, limits
+
+    def _analyze_full(self, text: str) -> tuple[list[dict], dict]:
+        deadline = self.preprocessor.deadline()
+        doc = self.preprocessor.process(text, deadline=deadline)
         aspects = self.aspect_extractor.extract(doc)
-        aspect_sentiments = self.associator.associate(aspects)
-        return [item.to_dict() for item in aspect_sentiments]
+        aspect_sentiments = self.associator.associate(aspects, deadline=deadline)
+
+        limits: dict = {}
+        if doc.user_data.get("truncated"):
+            limits["truncated"] = True
+            self.limit_stats.truncated += 1
+        if doc.user_data.get("timed_out") or self.associator.interrupted:
+            limits["timed_out"] = True
+            self.limit_stats.timed_out += 1
+        return [item.to_dict() for item in aspect_sentiments], limits
+
+    def analyze_reviews(self, reviews: list[str], metadata: list[dict] | None = None) -> list[ReviewAnalysis]:
+        """Analyze many reviews while preserving per-review traceability.
 
-    def analyze_reviews(self, reviews: list[str]) -> list[ReviewAnalysis]:
-        """Analyze many reviews while preserving per-review traceability."""
-        clean_reviews = [r.strip() for r in reviews if r and r.strip()]
+        ``metadata`` is optional and aligned with ``reviews``; each entry (e.g.
+        ``{"source": "phone-x", "timestamp": ...}``) is carried onto the matching
+        ``ReviewAnalysis`` so downstream stores can key on it.
+        """
+        if metadata is None:
+            metadata = [{} for _ in reviews]
+        if len(metadata) != len(reviews):
+            raise ValueError(f"metadata has {len(metadata)} entries for {len(reviews)} reviews")
+        clean_reviews = [(r.strip(), meta) for r, meta in zip(reviews, metadata) if r and r.strip()]
         output: list[ReviewAnalysis] = []
-        for idx, review in enumerate(clean_reviews, start=1):
-            output.append(ReviewAnalysis(review_id=idx, review_text=review, aspects=self.analyze(review)))
+        for idx, (review, meta) in enumerate(clean_reviews, start=1):
+            rows, limits = self._analyze(review)
+            output.append(ReviewAnalysis(review_id=idx, review_text=review, aspects=rows, metadata={**meta, **limits}))
         return output
 
     def aggregate_aspects(self, analyses: list[ReviewAnalysis]) -> list[dict]:
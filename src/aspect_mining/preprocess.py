@@ -1,13 +1,96 @@
 from __future__ import annotations
 
+import time
+from bisect import bisect_right
 from dataclasses import dataclass
 import spacy
 from spacy.language import Language
+from spacy.pipeline.sentencizer import Sentencizer
+from spacy.tokenizer import Tokenizer
+from spacy.tokens import Doc
+
+_PUNCT_CHARS = set(Sentencizer.default_punct_chars)
 
 
 @dataclass
 class PreprocessConfig:
     model_name: str = "en_core_web_sm"
+    # Reviews longer than this are parsed in sentence-aligned chunks.
+    long_doc_chars: int = 20_000
+    chunk_chars: int = 5_000
+    batch_size: int = 8
+    # Per-review limits; ``None`` disables. A review over the size limit is cut
+    # to its first ``max_review_chars`` (extended to the next whitespace so the
+    # last word stays whole) before any tokenizing or parsing. The time limit is one
+    # deadline for the whole analysis, checked between chunks while parsing and
+    # between aspects while associating. Truncation and parse timeouts are
+    # flagged in ``doc.user_data``; every hit is counted in
+    # ``AspectOpinionMiner.limit_stats``.
+    max_review_chars: int | None = None
+    max_review_seconds: float | None = None
+
+    def __post_init__(self):
+        for name in ("long_doc_chars", "chunk_chars", "batch_size"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive")
+        if self.max_review_chars is not None and self.max_review_chars <= 0:
+            raise ValueError("max_review_chars must be positive")
+        if self.max_review_seconds is not None and self.max_review_seconds < 0:
+            raise ValueError("max_review_seconds must not be negative")
+
+
+@dataclass
+class LimitStats:
+    truncated: int = 0
+    timed_out: int = 0
+
+
+def split_chunks(text: str, chunk_chars: int, tokenizer: Tokenizer) -> list[str]:
+    """Split ``text`` into chunks of at most ``chunk_chars`` at sentence breaks.
+
+    Cut points follow spaCy's ``sentencizer`` rule on the tokenized text: a new
+    sentence starts at the first non-punctuation token after sentence-final
+    punctuation. A cut is only made when that punctuation is followed by a
+    single space, so the space stays on the last token of the chunk exactly as
+    in a whole-document parse, and abbreviations such as ``Dr.`` (one token)
+    never cut. Newlines never cut.
+
+    Joining the chunks reproduces ``text`` exactly. A run longer than
+    ``chunk_chars`` without any cut point is split at its last space (or
+    hard-cut when there is none); such a split forces a sentence break the
+    whole-document parse would not make.
+    """
+    if chunk_chars <= 0:
+        raise ValueError("chunk_chars must be positive")
+    tokens = tokenizer(text)
+    cuts: list[int] = []
+    seen_period = False
+    for tok in tokens:
+        if seen_period and not tok.is_punct and tok.text not in _PUNCT_CHARS:
+            if tokens[tok.i - 1].whitespace_:
+                cuts.append(tok.idx)
+            seen_period = False
+        if tok.text in _PUNCT_CHARS:
+            seen_period = True
+
+    chunks: list[str] = []
+    start = 0
+    while len(text) - start > chunk_chars:
+        limit = start + chunk_chars
+        k = bisect_right(cuts, limit) - 1
+        if k >= 0 and cuts[k] > start:
+            end = cuts[k]
+        else:
+            end = text.rfind(" ", start, limit) + 1
+            if end <= start:
+                end = limit
+        # Always make progress, whatever the cut points look like.
+        end = max(end, start + 1)
+        chunks.append(text[start:end])
+        start = end
+    if start < len(text):
+        chunks.append(text[start:])
+    return chunks
 
 
 class TextPreprocessor:
@@ -32,5 +115,60 @@ class TextPreprocessor:
     def nlp(self) -> Language:
         return self._nlp
 
-    def process(self, text: str):
-        return self._nlp(text.strip())
+    def deadline(self) -> float | None:
+        """Return the ``time.perf_counter()`` deadline for a review starting now."""
+        if self.config.max_review_seconds is None:
+            return None
+        return time.perf_counter() + self.config.max_review_seconds
+
+    def process(self, text: str, deadline: float | None = None):
+        text = text.strip()
+        cfg = self.config
+        if deadline is None:
+            deadline = self.deadline()
+        over_limit = cfg.max_review_chars is not None and len(text) > cfg.max_review_chars
+        if len(text) <= cfg.long_doc_chars and not over_limit:
+            return self._nlp(text)
+        return self._process_chunked(text, deadline)
+
+    def _truncate(self, text: str) -> tuple[str, bool]:
+        limit = self.config.max_review_chars
+        if limit is None or len(text) <= limit:
+            return text, False
+        # Look for the next whitespace within one chunk; hard-cut otherwise.
+        window = text[limit : limit + self.config.chunk_chars]
+        extra = next((i for i, ch in enumerate(window) if ch.isspace()), 0)
+        return text[: limit + extra], True
+
+    def _process_chunked(self, text: str, deadline: float | None) -> Doc:
+        """Parse ``text`` as a batch of sentence-aligned chunks and stitch them.
+
+        Chunks are cut where the ``sentencizer`` would start a sentence (see
+        ``split_chunks``), so with the fallback pipeline the stitched ``Doc`` has
+        the same tokens, sentence texts and in-sentence distances as a
+        whole-document parse. With a statistical parser, sentence boundaries
+        are predicted and context crosses them, so a cut can occasionally
+        change a break or a parse; only per-chunk annotations are guaranteed
+        to survive stitching.
+        """
+        cfg = self.config
+        text, truncated = self._truncate(text)
+        chunks = split_chunks(text, min(cfg.chunk_chars, self._nlp.max_length), self._nlp.tokenizer)
+
+        # Parse one chunk at a time under a deadline, checking it before each
+        # chunk, so at most one chunk is parsed past it.
+        timed_out = False
+        docs: list[Doc] = []
+        batch_size = 1 if deadline is not None else cfg.batch_size
+        parsed = self._nlp.pipe(chunks, batch_size=batch_size)
+        for _ in chunks:
+            if deadline is not None and time.perf_counter() > deadline:
+                timed_out = True
+                break
+            docs.append(next(parsed))
+
+        doc = Doc.from_docs(docs, ensure_whitespace=False) if docs else self._nlp("")
+        doc.user_data["chunks"] = len(docs)
+        doc.user_data["truncated"] = truncated
+        doc.user_data["timed_out"] = timed_out
+        return doc
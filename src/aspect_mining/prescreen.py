@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from .lexicon import SENTIMENT_LEXICON
+
+# Inflections whose surface form does not start with the lexicon lemma.
+IRREGULAR_FORMS = {
+    "better": "good",
+    "best": "good",
+    "worse": "bad",
+    "worst": "bad",
+    "lit": "light",
+}
+
+PRESCREEN_MODES = {"off", "skip", "audit"}
+
+
+@dataclass
+class PrescreenStats:
+    screened: int = 0
+    skipped: int = 0
+    audited: int = 0
+    # Audited reviews whose full result differs from the fast path's ``[]``.
+    audit_mismatches: int = 0
+    # Neutral, evidence-free rows the fast path would have dropped.
+    audit_dropped_rows: int = 0
+    # Audited reviews whose full result carries sentiment or evidence, i.e.
+    # the pre-screen missed an opinion word.
+    audit_sentiment_mismatches: int = 0
+
+
+class LexiconPrescreener:
+    """Cheap check for whether a review can contain any lexicon opinion word.
+
+    Opinion tokens are matched on their lemma, so a review with no word that
+    could lemmatize to a ``SENTIMENT_LEXICON`` entry always yields neutral
+    aspects with empty evidence. The compiled pattern matches every word that
+    starts with a lexicon stem (trailing ``e``/``y`` dropped to cover
+    ``nicer`` / ``noisier``) plus known irregular forms. It may over-match
+    (``dim`` matches ``dimension``) but never under-matches, so a miss is a
+    safe signal to skip the parse.
+    """
+
+    def __init__(self, lexicon: dict[str, float] | None = None):
+        lexicon = SENTIMENT_LEXICON if lexicon is None else lexicon
+        stems = {self._stem(word) for word in lexicon}
+        irregular = {form for form, lemma in IRREGULAR_FORMS.items() if lemma in lexicon}
+        alternatives = sorted(stems | irregular, key=len, reverse=True)
+        self._pattern = re.compile(r"\b(?:" + "|".join(map(re.escape, alternatives)) + r")", re.IGNORECASE)
+
+    @staticmethod
+    def _stem(word: str) -> str:
+        word = word.lower()
+        if len(word) > 3 and word[-1] in "ey":
+            return word[:-1]
+        return word
+
+    def has_opinion(self, text: str) -> bool:
+        return self._pattern.search(text) is not None
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from datetime import date, datetime, timezone
+
+from .pipeline import ReviewAnalysis
+
+
+def _to_epoch(value) -> float:
+    if value is None:
+        return time.time()
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day, tzinfo=timezone.utc).timestamp()
+    if isinstance(value, str):
+        return _to_epoch(datetime.fromisoformat(value))
+    return float(value)
+
+
+class AspectAggregateStore:
+    """Incremental aspect sentiment roll-ups keyed by (source, time bucket, aspect).
+
+    Each ingested review adds its aspect rows to precomputed per-bucket sums in
+    an embedded SQLite table, so dashboard queries such as "aspect sentiment for
+    product X over the last 30 days" scan a handful of bucket rows instead of
+    re-aggregating raw reviews. Like ``aggregate_aspects``, an aspect is shown
+    with the casing of its most recently ingested mention.
+
+    The source key and timestamp are read from ``ReviewAnalysis.metadata``
+    (``"source"`` and ``"timestamp"`` by default). Reviews without a timestamp
+    are bucketed at ingestion time.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        bucket_seconds: int = 86400,
+        source_field: str = "source",
+        time_field: str = "timestamp",
+    ):
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        self.bucket_seconds = bucket_seconds
+        self.source_field = source_field
+        self.time_field = time_field
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS aspect_buckets (
+                source TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                aspect_key TEXT NOT NULL,
+                aspect TEXT NOT NULL,
+                frequency INTEGER NOT NULL,
+                positive INTEGER NOT NULL,
+                negative INTEGER NOT NULL,
+                neutral INTEGER NOT NULL,
+                score_sum REAL NOT NULL,
+                last_seen INTEGER NOT NULL,
+                PRIMARY KEY (source, bucket, aspect_key)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_aspect_buckets_bucket ON aspect_buckets (bucket)")
+        self._conn.commit()
+
+    def bucket_of(self, timestamp) -> int:
+        """Return the start (epoch seconds) of the bucket containing ``timestamp``."""
+        epoch = int(_to_epoch(timestamp))
+        return epoch - epoch % self.bucket_seconds
+
+    def add(self, analysis: ReviewAnalysis) -> None:
+        """Ingest one review's aspect rows."""
+        self.add_many([analysis])
+
+    def add_many(self, analyses: list[ReviewAnalysis]) -> None:
+        """Ingest many reviews in a single transaction."""
+        # ``last_seen`` is a global ingestion sequence number used to pick the
+        # most recent casing of an aspect across buckets at query time.
+        (seen,) = self._conn.execute("SELECT COALESCE(MAX(last_seen), 0) FROM aspect_buckets").fetchone()
+        sums: dict[tuple[str, int, str], dict] = {}
+        for review in analyses:
+            source = str(review.metadata.get(self.source_field, ""))
+            bucket = self.bucket_of(review.metadata.get(self.time_field))
+            for row in review.aspects:
+                key = (source, bucket, row["aspect"].lower())
+                rec = sums.setdefault(
+                    key, {"aspect": row["aspect"], "frequency": 0, "positive": 0, "negative": 0, "neutral": 0, "score_sum": 0.0}
+                )
+                seen += 1
+                rec["aspect"] = row["aspect"]
+                rec["last_seen"] = seen
+                rec["frequency"] += 1
+                rec[row["sentiment"]] += 1
+                rec["score_sum"] += row["score"]
+
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO aspect_buckets
+                    (source, bucket, aspect_key, aspect, frequency, positive, negative, neutral, score_sum, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source, bucket, aspect_key) DO UPDATE SET
+                    aspect = excluded.aspect,
+                    frequency = frequency + excluded.frequency,
+                    positive = positive + excluded.positive,
+                    negative = negative + excluded.negative,
+                    neutral = neutral + excluded.neutral,
+                    score_sum = score_sum + excluded.score_sum,
+                    last_seen = excluded.last_seen
+                """,
+                [
+                    (
+                        source,
+                        bucket,
+                        aspect_key,
+                        rec["aspect"],
+                        rec["frequency"],
+                        rec["positive"],
+                        rec["negative"],
+                        rec["neutral"],
+                        rec["score_sum"],
+                        rec["last_seen"],
+                    )
+                    for (source, bucket, aspect_key), rec in sums.items()
+                ],
+            )
+
+    def query(self, source: str | None = None, start=None, end=None) -> list[dict]:
+        """Roll up bucket sums into rows shaped like ``aggregate_aspects`` output.
+
+        ``start`` is rounded down to the start of its bucket, and every bucket
+        that starts before ``end`` is included, so buckets partially covered at
+        either edge are counted in full.
+        """
+        clauses: list[str] = []
+        params: list = []
+        if source is not None:
+            clauses.append("source = ?")
+            params.append(source)
+        if start is not None:
+            clauses.append("bucket >= ?")
+            params.append(self.bucket_of(start))
+        if end is not None:
+            clauses.append("bucket < ?")
+            params.append(_to_epoch(end))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        cursor = self._conn.execute(
+            f"""
+            SELECT aspect, MAX(last_seen), SUM(frequency), SUM(positive), SUM(negative), SUM(neutral), SUM(score_sum)
+            FROM aspect_buckets {where}
+            GROUP BY aspect_key
+            """,
+            params,
+        )
+
+        # SQLite takes the bare ``aspect`` column from the row holding MAX(last_seen).
+        results: list[dict] = []
+        for aspect, _, frequency, positive, negative, neutral, score_sum in cursor:
+            sentiment_counts = {"positive": positive, "negative": negative, "neutral": neutral}
+            results.append(
+                {
+                    "aspect": aspect,
+                    "frequency": frequency,
+                    "positive": positive,
+                    "negative": negative,
+                    "neutral": neutral,
+                    "avg_score": round(score_sum / frequency, 3),
+                    "dominant_sentiment": max(sentiment_counts, key=sentiment_counts.get),
+                }
+            )
+        return sorted(results, key=lambda x: (-x["frequency"], x["aspect"].lower()))
+
+    def last_days(self, source: str | None, days: int, now=None) -> list[dict]:
+        """Convenience roll-up for the trailing ``days`` window ending at ``now``."""
+        end = _to_epoch(now)
+        return self.query(source=source, start=end - days * 86400, end=end)
+
+    def close(self) -> None:
+        self._conn.close()
@@ -51,7 +51,7 @@ def _conservative_nearest_opinion(analyses: list[ReviewAnalysis]) -> list[Review
                 rows.append({**row, "score": round(score, 3), "sentiment": sentiment, "evidences": [best]})
             else:
                 rows.append(row)
-        out.append(ReviewAnalysis(review_id=item.review_id, review_text=item.review_text, aspects=rows))
+        out.append(ReviewAnalysis(review_id=item.review_id, review_text=item.review_text, aspects=rows, metadata=item.metadata))
     return out
 
 
@@ -68,7 +68,7 @@ def _recall_boost_with_frequency_weight(analyses: list[ReviewAnalysis]) -> list[
             score = round(row["score"] * repeat_boost, 3)
             sentiment = "positive" if score > 0.35 else "negative" if score < -0.35 else "neutral"
             rows.append({**row, "score": score, "sentiment": sentiment, "repeat_boost": round(repeat_boost, 2)})
-        out.append(ReviewAnalysis(review_id=item.review_id, review_text=item.review_text, aspects=rows))
+        out.append(ReviewAnalysis(review_id=item.review_id, review_text=item.review_text, aspects=rows, metadata=item.metadata))
     return out
 
 
@@ -85,7 +85,7 @@ def _contrast_mode(analyses: list[ReviewAnalysis]) -> list[ReviewAnalysis]:
                 score = round(score * 1.2, 3)
             sentiment = "positive" if score > 0.45 else "negative" if score < -0.45 else "neutral"
             rows.append({**row, "score": score, "sentiment": sentiment, "contrastive_review": is_contrastive})
-        out.append(ReviewAnalysis(review_id=item.review_id, review_text=item.review_text, aspects=rows))
+        out.append(ReviewAnalysis(review_id=item.review_id, review_text=item.review_text, aspects=rows, metadata=item.metadata))
     return out
 
 
@@ -1,4 +1,8 @@
-from aspect_mining import AspectOpinionMiner
+import pytest
+import spacy
+
+from aspect_mining import AspectAggregateStore, AspectOpinionMiner, LexiconPrescreener, ReviewAnalysis
+from aspect_mining.preprocess import PreprocessConfig, TextPreprocessor, split_chunks
 from aspect_mining.variants import run_variant
 
 
@@ -46,3 +50,170 @@ def test_variants_produce_distinct_outputs():
     v2_mentions = sum(len(r.aspects) for r in v2["reviews"])
 
     assert v1_mentions >= v2_mentions
+
+
+def test_aggregate_store_rolls_up_by_source_and_time():
+    def row(aspect, sentiment, score):
+        return {"aspect": aspect, "sentiment": sentiment, "score": score, "sentence": "", "evidences": []}
+
+    day = 86400
+    store = AspectAggregateStore()
+    store.add_many(
+        [
+            ReviewAnalysis(1, "", [row("Battery", "positive", 1.0)], {"source": "phone-x", "timestamp": 10 * day}),
+            ReviewAnalysis(2, "", [row("battery", "negative", -1.0)], {"source": "phone-x", "timestamp": 40 * day}),
+            ReviewAnalysis(3, "", [row("battery", "positive", 2.0)], {"source": "phone-y", "timestamp": 40 * day}),
+        ]
+    )
+    store.add(ReviewAnalysis(4, "", [row("battery", "negative", -0.5)], {"source": "phone-x", "timestamp": 41 * day}))
+
+    recent = store.last_days("phone-x", 30, now=42 * day)
+    assert len(recent) == 1
+    assert recent[0]["frequency"] == 2
+    assert recent[0]["negative"] == 2
+    assert recent[0]["avg_score"] == -0.75
+
+    everything = store.query()
+    assert everything[0]["frequency"] == 4
+    assert everything[0]["positive"] == 2
+
+    # The most recently ingested casing wins, as in aggregate_aspects.
+    store.add(ReviewAnalysis(5, "", [row("BATTERY", "neutral", 0.0)], {"source": "phone-y", "timestamp": 5 * day}))
+    assert store.query()[0]["aspect"] == "BATTERY"
+
+
+def test_analyze_reviews_rejects_misaligned_metadata():
+    miner = AspectOpinionMiner()
+    with pytest.raises(ValueError):
+        miner.analyze_reviews(["Battery is great.", "Screen is bad."], metadata=[{"source": "a"}])
+
+
+def test_prescreen_matches_inflections_and_skips_opinion_free_reviews():
+    screener = LexiconPrescreener()
+    assert screener.has_opinion("The screen is nicer and it loads faster.")
+    assert screener.has_opinion("Best purchase this year.")
+    assert not screener.has_opinion("Order 12345 arrived on time.")
+
+    reviews = ["Order 12345 arrived on time.", "Battery life is great."]
+    skipping = AspectOpinionMiner(prescreen="skip")
+    auditing = AspectOpinionMiner(prescreen="audit")
+    skipped = skipping.analyze_reviews(reviews)
+    audited = auditing.analyze_reviews(reviews)
+
+    assert skipped[0].aspects == []
+    assert skipped[1].aspects == audited[1].aspects
+    assert skipping.prescreen_stats.screened == 2
+    assert skipping.prescreen_stats.skipped == 1
+
+    stats = auditing.prescreen_stats
+    assert (stats.screened, stats.skipped, stats.audited) == (2, 0, 1)
+    # The full parse still yields neutral rows (e.g. "Order") that skip drops.
+    assert audited[0].aspects
+    assert all(row["sentiment"] == "neutral" and not row["evidences"] for row in audited[0].aspects)
+    assert stats.audit_mismatches == 1
+    assert stats.audit_dropped_rows == len(audited[0].aspects)
+    assert stats.audit_sentiment_mismatches == 0
+
+
+def test_split_chunks_is_lossless_and_bounded():
+    tokenizer = TextPreprocessor().nlp.tokenizer
+    text = "Battery life is great. Camera is bad!\nScreen is amazing. " + "word " * 40
+    chunks = split_chunks(text, 30, tokenizer)
+
+    assert "".join(chunks) == text
+    assert all(len(chunk) <= 30 for chunk in chunks)
+    assert chunks[0] == "Battery life is great. "
+
+    # Abbreviations and newlines are not sentence cuts.
+    assert split_chunks("The Dr. Smith phone is great. Battery is bad! ", 40, tokenizer) == [
+        "The Dr. Smith phone is great. ",
+        "Battery is bad! ",
+    ]
+    assert split_chunks("Battery is great.\nCamera is bad. Screen is good. ", 40, tokenizer) == [
+        "Battery is great.\nCamera is bad. ",
+        "Screen is good. ",
+    ]
+
+
+def test_chunking_rejects_non_positive_sizes():
+    for bad in ({"chunk_chars": 0}, {"long_doc_chars": 0}, {"max_review_chars": 0}):
+        with pytest.raises(ValueError):
+            PreprocessConfig(**bad)
+    with pytest.raises(ValueError):
+        split_chunks("abc def", 0, TextPreprocessor().nlp.tokenizer)
+
+
+def test_long_review_chunking_matches_whole_document():
+    texts = [
+        " ".join(["Battery life is great but camera quality is not good."] * 20),
+        "The Dr. Smith phone is great.  Battery is bad!  " * 5,
+        "Battery life is great.\nCamera quality is not good. Screen is amazing.\n\n" * 5,
+    ]
+    config = PreprocessConfig(long_doc_chars=20, chunk_chars=80)
+    whole_miner = AspectOpinionMiner()
+    chunked_miner = AspectOpinionMiner(preprocess_config=config)
+
+    for text in texts:
+        doc = chunked_miner.preprocessor.process(text)
+        assert doc.user_data["chunks"] > 1
+        assert doc.text == text.strip()
+        assert chunked_miner.analyze(text) == whole_miner.analyze(text)
+
+
+@pytest.mark.skipif(not spacy.util.is_package("en_core_web_sm"), reason="en_core_web_sm is not installed")
+def test_chunk_stitching_keeps_parser_annotations():
+    text = "Battery life is great but camera quality is not good. The screen is bright and the speakers are weak. " * 4
+    preprocessor = TextPreprocessor(PreprocessConfig(long_doc_chars=20, chunk_chars=120))
+    assert not preprocessor.using_fallback
+
+    stitched = preprocessor.process(text)
+    chunk_docs = [preprocessor.nlp(chunk) for chunk in split_chunks(text.strip(), 120, preprocessor.nlp.tokenizer)]
+    assert stitched.user_data["chunks"] == len(chunk_docs) > 1
+
+    expected_tokens, expected_chunks, offset = [], [], 0
+    for chunk_doc in chunk_docs:
+        expected_tokens.extend((tok.text, tok.pos_, tok.dep_, tok.head.i + offset, tok.is_sent_start) for tok in chunk_doc)
+        expected_chunks.extend((nc.start + offset, nc.end + offset) for nc in chunk_doc.noun_chunks)
+        offset += len(chunk_doc)
+
+    assert [(tok.text, tok.pos_, tok.dep_, tok.head.i, tok.is_sent_start) for tok in stitched] == expected_tokens
+    assert [(nc.start, nc.end) for nc in stitched.noun_chunks] == expected_chunks
+    assert AspectOpinionMiner(preprocess_config=preprocessor.config).analyze(text)
+
+
+def test_long_review_size_and_time_limits():
+    text = "Battery life is great. " * 3
+    doc = TextPreprocessor(PreprocessConfig(max_review_chars=30)).process(text)
+    assert doc.user_data["truncated"]
+    assert doc.text.startswith("Battery life is great.")
+    assert len(doc.text) <= 40
+
+    # The cap is applied before tokenizing, so a huge review with a small cap
+    # and a tight deadline still yields rows for the kept prefix.
+    huge = "Battery life is great. " * 200_000
+    capped = AspectOpinionMiner(preprocess_config=PreprocessConfig(max_review_chars=5_000, max_review_seconds=0.5))
+    rows = capped.analyze(huge)
+    assert rows
+    assert any("battery" in row["aspect"].lower() and row["sentiment"] == "positive" for row in rows)
+    assert capped.limit_stats.truncated == 1
+
+    # A zero deadline stops parsing before the first chunk and association
+    # before the first aspect, for long and short reviews alike.
+    config = PreprocessConfig(long_doc_chars=20, chunk_chars=40, max_review_seconds=0.0)
+    miner = AspectOpinionMiner(preprocess_config=config)
+    doc = miner.preprocessor.process(text)
+    assert doc.user_data["timed_out"]
+    assert doc.user_data["chunks"] == 0
+
+    assert miner.analyze(text) == []
+    assert miner.analyze("Battery is great.") == []
+    assert miner.limit_stats.timed_out == 2
+    (partial,) = miner.analyze_reviews(["Battery is great."], metadata=[{"source": "a"}])
+    assert partial.metadata == {"source": "a", "timed_out": True}
+
+    # A generous deadline that is never hit leaves the review unflagged.
+    relaxed = AspectOpinionMiner(preprocess_config=PreprocessConfig(max_review_seconds=60.0))
+    (complete,) = relaxed.analyze_reviews(["Battery is great."])
+    assert complete.aspects
+    assert complete.metadata == {}
+    assert relaxed.limit_stats.timed_out == 0